@@ -1,6 +1,7 @@
 from app.utils.redis_manager import r
 import uuid, time, json, asyncio
 from app.models.ticket import MatchmakingTicket, Player
+from app.worker.team_partition import partition_units, DEFAULT_BUDGET_MICROS
 from typing import List, Optional, Dict
 
 # Config file impot 
@@ -107,27 +108,23 @@ async def find_match_proposal(pool_key: str, anchor_ticket: MatchmakingTicket, m
                 return proposal 
 
 def balance_teams(proposal: List[MatchmakingTicket], rules: dict) -> Dict[str, List[Dict]]:
-    if not proposal:
+    # Parties stay together; each team gets exactly `teamSize` players with the smallest
+    # possible skill gap, searched within `balanceBudgetMicros` (see team_partition.py).
+    units = [t for t in proposal if t.players]
+    if not units:
         return {}
-    
-    units = sorted(proposal, key=lambda t: sum(p.skill for p in t.players) / len(t.players), reverse=True)
-    
-    teams = [[] for _ in range(rules['numTeams'])]
-    team_skills = [0.0] * rules['numTeams']
 
-    for unit in units:
-        if not unit.players:
-            continue
-            
-        # Find the team with the lowest total skill
-        weakest_team_index = team_skills.index(min(team_skills))
-        
-        # Add all players from this unit to the weakest team
-        player_data = [p.model_dump() for p in unit.players]
-        teams[weakest_team_index].extend(player_data)
-        
-        # Update team skill (sum of individual player skills)
-        team_skills[weakest_team_index] += sum(p.skill for p in unit.players)
+    assignment = partition_units(
+        [len(unit.players) for unit in units],
+        [sum(p.skill for p in unit.players) for unit in units],
+        rules['teamSize'],
+        rules['numTeams'],
+        rules.get('balanceBudgetMicros', DEFAULT_BUDGET_MICROS),
+    )
+
+    teams = [[] for _ in range(rules['numTeams'])]
+    for unit, team_index in zip(units, assignment):
+        teams[team_index].extend(p.model_dump() for p in unit.players)
 
     return {f"team_{i+1}": team for i, team in enumerate(teams)}
 
@@ -0,0 +1,242 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+# Team partitioning: split whole parties (units) into `num_teams` teams of
+# exactly `team_size` players while minimising the skill spread
+# (strongest team total - weakest team total). Parties are never split.
+
+DEFAULT_BUDGET_MICROS = 2000   # Per-match search budget if the mode does not set `balanceBudgetMicros`
+DEADLINE_CHECK_EVERY = 16      # Nodes visited between clock reads in the tree search
+
+
+def partition_units(sizes: List[int], skills: List[int], team_size: int, num_teams: int,
+                    budget_micros: int = DEFAULT_BUDGET_MICROS) -> List[int]:
+    """
+    Returns the team index for every unit (same order as `sizes`/`skills`).
+    `skills` are the total skill of each unit, not the average.
+
+    Party sizes alone decide whether an exact-size split exists; if not, the
+    uncapped greedy split is used straight away. Otherwise a complete greedy tree
+    search looks for the smallest spread until the budget runs out (exact when it
+    finishes). If the budget runs out before the search reaches any split, the
+    parties are dealt into the team shapes the size check found, so teams get
+    exactly `team_size` players whenever that is possible.
+    """
+    deadline = time.perf_counter_ns() + budget_micros * 1000
+
+    if sum(sizes) != team_size * num_teams:
+        return greedy_partition(sizes, skills, num_teams)
+
+    fits = {}
+    counts = _size_counts(sizes, team_size)
+    # Not bounded by the budget: it only looks at party sizes and is cheap next to the search.
+    if not _fits(counts, _room([team_size] * num_teams), fits, None):
+        return greedy_partition(sizes, skills, num_teams)
+
+    assignment = _tree_search(sizes, skills, team_size, num_teams, deadline, fits)
+    if assignment is None:
+        assignment = _slot_partition(sizes, skills, _team_slots(counts, team_size, num_teams, fits))
+    return assignment
+
+
+def has_exact_split(sizes: List[int], team_size: int, num_teams: int) -> bool:
+    """True if the parties can fill `num_teams` teams with exactly `team_size` players each."""
+    if sum(sizes) != team_size * num_teams:
+        return False
+    return _fits(_size_counts(sizes, team_size), _room([team_size] * num_teams), {}, None)
+
+
+def greedy_partition(sizes: List[int], skills: List[int], num_teams: int) -> List[int]:
+    """Strongest unit (by average skill) to the currently weakest team. Ignores team size caps."""
+    order = sorted(range(len(sizes)), key=lambda i: skills[i] / sizes[i], reverse=True)
+    team_skills = [0] * num_teams
+    assignment = [0] * len(sizes)
+
+    for i in order:
+        weakest_team_index = team_skills.index(min(team_skills))
+        assignment[i] = weakest_team_index
+        team_skills[weakest_team_index] += skills[i]
+
+    return assignment
+
+
+def team_spread(assignment: List[int], skills: List[int], num_teams: int) -> int:
+    team_skills = [0] * num_teams
+    for i, team in enumerate(assignment):
+        team_skills[team] += skills[i]
+    return max(team_skills) - min(team_skills)
+
+
+def _size_counts(sizes: List[int], team_size: int) -> Tuple[int, ...]:
+    # counts[s] = number of parties with s players (index 0 unused).
+    counts = [0] * (team_size + 1)
+    for size in sizes:
+        counts[size] += 1
+    return tuple(counts)
+
+
+class _OutOfTime(Exception):
+    pass
+
+
+def _fits(counts: Tuple[int, ...], room: Tuple[int, ...], memo: Dict, deadline: Optional[int]) -> bool:
+    # Can these parties exactly fill the free slots in `room` (sorted, full teams
+    # dropped)? Only party sizes matter, so the answer is shared by every branch with
+    # the same remaining parties and free slots. Largest party placed first.
+    key = (counts, room)
+    if key in memo:
+        return memo[key]
+    if deadline is not None and time.perf_counter_ns() > deadline:
+        raise _OutOfTime()
+
+    size = _largest_size(counts)
+    if size <= 1:
+        result = True  # Totals always match, so solo players can fill whatever is left
+    elif counts[size] > sum(free // size for free in room):
+        result = False
+    else:
+        rest = counts[:size] + (counts[size] - 1,) + counts[size + 1:]
+        result = False
+        for team, free in enumerate(room):
+            if free < size or (team and free == room[team - 1]):
+                continue
+            if _fits(rest, _take(room, team, size), memo, deadline):
+                result = True
+                break
+
+    memo[key] = result
+    return result
+
+
+def _largest_size(counts: Tuple[int, ...]) -> int:
+    return next((s for s in range(len(counts) - 1, 0, -1) if counts[s]), 0)
+
+
+def _take(room: Tuple[int, ...], team: int, size: int) -> Tuple[int, ...]:
+    return _room(room[:team] + (room[team] - size,) + room[team + 1:])
+
+
+def _room(frees) -> Tuple[int, ...]:
+    return tuple(sorted(free for free in frees if free))
+
+
+def _team_slots(counts: Tuple[int, ...], team_size: int, num_teams: int, memo: Dict) -> List[List[int]]:
+    # Replays the placements `_fits` found (every step is already in the memo) and
+    # returns the party sizes each team should hold.
+    frees = [team_size] * num_teams
+    slots = [[] for _ in range(num_teams)]
+
+    while True:
+        size = _largest_size(counts)
+        if size <= 1:
+            # Solo players fill the rest.
+            for team in range(num_teams):
+                slots[team].extend([1] * frees[team])
+            return slots
+        rest = counts[:size] + (counts[size] - 1,) + counts[size + 1:]
+        for team in sorted(range(num_teams), key=lambda t: frees[t]):
+            if frees[team] < size:
+                continue
+            after = frees[:team] + [frees[team] - size] + frees[team + 1:]
+            if memo.get((rest, _room(after))):
+                break
+        slots[team].append(size)
+        frees[team] -= size
+        counts = rest
+
+
+def _slot_partition(sizes: List[int], skills: List[int], slots: List[List[int]]) -> List[int]:
+    # Strongest unit to the weakest team that still has a free slot of its size.
+    order = sorted(range(len(sizes)), key=lambda i: skills[i], reverse=True)
+    team_skills = [0] * len(slots)
+    assignment = [0] * len(sizes)
+
+    for i in order:
+        open_teams = [t for t in range(len(slots)) if sizes[i] in slots[t]]
+        weakest_team_index = min(open_teams, key=lambda t: team_skills[t])
+        slots[weakest_team_index].remove(sizes[i])
+        assignment[i] = weakest_team_index
+        team_skills[weakest_team_index] += skills[i]
+
+    return assignment
+
+
+def _tree_search(sizes: List[int], skills: List[int], team_size: int, num_teams: int,
+                 deadline: int, fits: Dict) -> Optional[List[int]]:
+    # Complete Greedy Algorithm: units in descending skill order, weakest team tried
+    # first, so the first leaf reached is the capacity-aware greedy split and every
+    # later leaf can only improve on it. Branch-and-bound prunes the rest, and
+    # branches whose remaining parties can no longer fill the teams are skipped.
+    # Stops at the deadline; None if that comes before the first leaf.
+    order = sorted(range(len(sizes)), key=lambda i: skills[i], reverse=True)
+    total = sum(skills)
+    perfect = 0 if total % num_teams == 0 else 1  # Integer skills: best possible spread
+
+    remaining = [0] * (len(order) + 1)
+    suffix_counts = [()] * (len(order) + 1)
+    counts = [0] * (team_size + 1)
+    suffix_counts[len(order)] = tuple(counts)
+    for depth in range(len(order) - 1, -1, -1):
+        remaining[depth] = remaining[depth + 1] + skills[order[depth]]
+        counts[sizes[order[depth]]] += 1
+        suffix_counts[depth] = tuple(counts)
+
+    team_skills = [0] * num_teams
+    team_counts = [0] * num_teams
+    current = [0] * len(sizes)
+    best = {"spread": None, "assignment": None}
+    nodes = 0
+
+    def search(depth: int) -> bool:
+        # Returns True when the search should stop (perfect split or out of time).
+        nonlocal nodes
+        nodes += 1
+        if nodes % DEADLINE_CHECK_EVERY == 0 and time.perf_counter_ns() > deadline:
+            return True
+
+        if depth == len(order):
+            spread = max(team_skills) - min(team_skills)
+            if best["spread"] is None or spread < best["spread"]:
+                best["spread"] = spread
+                best["assignment"] = current[:]
+            return spread <= perfect or time.perf_counter_ns() > deadline
+
+        # Lower bound: the strongest team can only grow, and the weakest team can end
+        # no higher than the average nor above its total plus everything left.
+        if best["spread"] is not None:
+            strongest = max(team_skills)
+            bound = max(strongest * num_teams - total, (strongest - min(team_skills) - remaining[depth]) * num_teams)
+            if bound >= best["spread"] * num_teams:
+                return False
+
+        unit = order[depth]
+        seen = set()
+        for team in sorted(range(num_teams), key=lambda t: team_skills[t]):
+            if team_counts[team] + sizes[unit] > team_size:
+                continue
+            # Teams in an identical state are interchangeable; only try one of them.
+            state = (team_counts[team], team_skills[team])
+            if state in seen:
+                continue
+            seen.add(state)
+
+            team_counts[team] += sizes[unit]
+            room = _room(team_size - c for c in team_counts)
+            if not _fits(suffix_counts[depth + 1], room, fits, deadline):
+                team_counts[team] -= sizes[unit]
+                continue
+
+            team_skills[team] += skills[unit]
+            current[unit] = team
+            stop = search(depth + 1)
+            team_counts[team] -= sizes[unit]
+            team_skills[team] -= skills[unit]
+            if stop:
+                return True
+        return False
+
+    try:
+        search(0)
+    except _OutOfTime:
+        pass
+    return best["assignment"]
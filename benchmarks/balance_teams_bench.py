@@ -0,0 +1,99 @@
+# Micro-benchmark for team balancing.
+# Run from the repo root:  python -m benchmarks.balance_teams_bench [matches_per_mode]
+#
+# For every mode in gameModes.json, plus a few larger synthetic 2-team and multi-team
+# modes, generates random match proposals (random party sizes and skills), then
+# reports for the old greedy split and the partition engine: the skill spread
+# (strongest team - weakest team), how often teams got exactly teamSize players
+# among proposals where that is possible, the time per match and how many matches
+# ran more than 10% over budget.
+import json, random, sys, time
+from app.worker.team_partition import partition_units, greedy_partition, has_exact_split, team_spread, DEFAULT_BUDGET_MICROS
+
+SEED = 17
+MIN_SKILL, MAX_SKILL = 800, 2400
+
+# Larger than anything in gameModes.json, so the budget actually cuts the search short.
+SYNTHETIC_MODES = {
+    "10v10*": {"teamSize": 10, "numTeams": 2},
+    "20v20*": {"teamSize": 20, "numTeams": 2},
+    "3x5*": {"teamSize": 5, "numTeams": 3},
+    "4x4*": {"teamSize": 4, "numTeams": 4},
+    "6x5*": {"teamSize": 5, "numTeams": 6},
+    "4x8*": {"teamSize": 8, "numTeams": 4},
+}
+
+
+def random_proposal(rng: random.Random, team_size: int, num_teams: int):
+    # Split the match into parties of 1..teamSize players, like find_match_proposal would.
+    players_left = team_size * num_teams
+    sizes, skills = [], []
+    while players_left:
+        size = rng.randint(1, min(team_size, players_left, 3))
+        players_left -= size
+        sizes.append(size)
+        skills.append(sum(rng.randint(MIN_SKILL, MAX_SKILL) for _ in range(size)))
+    return sizes, skills
+
+
+def team_sizes_ok(assignment, sizes, team_size, num_teams):
+    counts = [0] * num_teams
+    for i, team in enumerate(assignment):
+        counts[team] += sizes[i]
+    return all(c == team_size for c in counts)
+
+
+def run_mode(mode: str, rules: dict, matches: int):
+    rng = random.Random(SEED)
+    team_size, num_teams = rules['teamSize'], rules['numTeams']
+    budget = rules.get('balanceBudgetMicros', DEFAULT_BUDGET_MICROS)
+    proposals = [random_proposal(rng, team_size, num_teams) for _ in range(matches)]
+    feasible = [has_exact_split(sizes, team_size, num_teams) for sizes, _ in proposals]
+
+    results = {}
+    for name, solve in (
+        ("greedy", lambda sizes, skills: greedy_partition(sizes, skills, num_teams)),
+        ("engine", lambda sizes, skills: partition_units(sizes, skills, team_size, num_teams, budget)),
+    ):
+        spreads, valid, worst_ns, over_budget = [], 0, 0, 0
+        start = time.perf_counter_ns()
+        for (sizes, skills), has_split in zip(proposals, feasible):
+            t0 = time.perf_counter_ns()
+            assignment = solve(sizes, skills)
+            took_ns = time.perf_counter_ns() - t0
+            worst_ns = max(worst_ns, took_ns)
+            over_budget += took_ns > budget * 1100
+            spreads.append(team_spread(assignment, skills, num_teams))
+            valid += has_split and team_sizes_ok(assignment, sizes, team_size, num_teams)
+        elapsed_ns = time.perf_counter_ns() - start
+        spreads.sort()
+        results[name] = {
+            "avg_spread": sum(spreads) / len(spreads),
+            "p95_spread": spreads[int(len(spreads) * 0.95) - 1],
+            "feasible": sum(feasible) / len(proposals) * 100,
+            "valid_sizes": valid / max(sum(feasible), 1) * 100,
+            "avg_us": elapsed_ns / len(proposals) / 1000,
+            "max_us": worst_ns / 1000,
+            "over_budget": over_budget / len(proposals) * 100,
+        }
+    return results
+
+
+def main():
+    matches = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with open("gameModes.json", 'r') as f:
+        game_rules = json.load(f)
+    game_rules.update(SYNTHETIC_MODES)
+
+    print(f"{matches} matches per mode, seed {SEED}, budget {DEFAULT_BUDGET_MICROS} us (* = synthetic mode)")
+    print("feasible % = proposals where exact team sizes are possible; sizes ok % = of those, how many got them")
+    print(f"{'mode':<12} {'solver':<7} {'avg spread':>11} {'p95 spread':>11} {'feasible %':>11} {'sizes ok %':>11} "
+          f"{'avg us':>9} {'max us':>9} {'>110% budget %':>15}")
+    for mode, rules in game_rules.items():
+        for name, res in run_mode(mode, rules, matches).items():
+            print(f"{mode:<12} {name:<7} {res['avg_spread']:>11.1f} {res['p95_spread']:>11} {res['feasible']:>11.1f} "
+                  f"{res['valid_sizes']:>11.1f} {res['avg_us']:>9.1f} {res['max_us']:>9.1f} {res['over_budget']:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import itertools, random, time
+from app.worker.team_partition import partition_units, greedy_partition, has_exact_split, team_spread
+
+
+def random_match(rng: random.Random, team_size: int, num_teams: int, max_party: int = 3):
+    players_left = team_size * num_teams
+    sizes = []
+    while players_left:
+        size = rng.randint(1, min(team_size, players_left, max_party))
+        players_left -= size
+        sizes.append(size)
+    skills = [sum(rng.randint(800, 2400) for _ in range(size)) for size in sizes]
+    return sizes, skills
+
+
+def team_counts(assignment, sizes, num_teams):
+    counts = [0] * num_teams
+    for i, team in enumerate(assignment):
+        counts[team] += sizes[i]
+    return counts
+
+
+def brute_force_best_spread(sizes, skills, team_size, num_teams):
+    best = None
+    for assignment in itertools.product(range(num_teams), repeat=len(sizes)):
+        if all(c == team_size for c in team_counts(assignment, sizes, num_teams)):
+            spread = team_spread(assignment, skills, num_teams)
+            best = spread if best is None or spread < best else best
+    return best
+
+
+def small_matches(count: int):
+    rng = random.Random(7)
+    matches = []
+    while len(matches) < count:
+        num_teams, team_size = rng.choice([2, 2, 3, 4]), rng.randint(1, 5)
+        sizes, skills = random_match(rng, team_size, num_teams, max_party=4)
+        if len(sizes) <= 8:
+            matches.append((sizes, skills, team_size, num_teams))
+    return matches
+
+
+def test_partition_units_is_optimal_with_exact_team_sizes():
+    for sizes, skills, team_size, num_teams in small_matches(400):
+        best = brute_force_best_spread(sizes, skills, team_size, num_teams)
+        assert has_exact_split(sizes, team_size, num_teams) == (best is not None)
+        if best is None:
+            continue
+        assignment = partition_units(sizes, skills, team_size, num_teams, budget_micros=10**7)
+        assert team_counts(assignment, sizes, num_teams) == [team_size] * num_teams
+        assert team_spread(assignment, skills, num_teams) == best
+
+
+def test_zero_budget_still_gives_exact_team_sizes():
+    for sizes, skills, team_size, num_teams in small_matches(400):
+        if not has_exact_split(sizes, team_size, num_teams):
+            continue
+        assignment = partition_units(sizes, skills, team_size, num_teams, budget_micros=0)
+        assert team_counts(assignment, sizes, num_teams) == [team_size] * num_teams
+
+
+def test_no_exact_split_falls_back_to_greedy_within_budget():
+    rng = random.Random(3)
+    checked = 0
+    while checked < 50:
+        team_size, num_teams = rng.choice([(5, 2), (5, 3), (4, 4), (5, 6), (8, 4)])
+        sizes, skills = random_match(rng, team_size, num_teams)
+        if has_exact_split(sizes, team_size, num_teams):
+            continue
+        checked += 1
+        elapsed = []
+        for _ in range(3):
+            start = time.perf_counter_ns()
+            assignment = partition_units(sizes, skills, team_size, num_teams, budget_micros=2000)
+            elapsed.append(time.perf_counter_ns() - start)
+        assert assignment == greedy_partition(sizes, skills, num_teams)
+        assert min(elapsed) < 2000 * 1000
+
+
+def test_large_matches_stay_close_to_budget():
+    rng = random.Random(11)
+    for team_size, num_teams in [(20, 2), (10, 6), (8, 4)]:
+        sizes, skills = random_match(rng, team_size, num_teams)
+        elapsed = []
+        for _ in range(3):
+            start = time.perf_counter_ns()
+            assignment = partition_units(sizes, skills, team_size, num_teams, budget_micros=1000)
+            elapsed.append(time.perf_counter_ns() - start)
+        if has_exact_split(sizes, team_size, num_teams):
+            assert team_counts(assignment, sizes, num_teams) == [team_size] * num_teams
+        # Clock reads are periodic, so allow a little overrun; the minimum filters scheduler noise.
+        assert min(elapsed) < 1500 * 1000